@@ -6,9 +6,11 @@
 # distribution of this software and related documentation without an express
 # license agreement from NVIDIA CORPORATION is strictly prohibited. 
 
+from functools import partial
+
 import omni.ext
 from omni.kit.viewport.registry import RegisterScene
-from .line import LineManipulator
+from .line import LineManipulator, Manager
 
 
 # Functions and vars are available to other extension as usual in python: `example.python_ext.some_public_function(x)`
@@ -25,8 +27,11 @@ class OmniExampleGestureExtension(omni.ext.IExt):
     # this extension is located on filesystem.
     def on_startup(self, ext_id):
         print("[omni.example.gesture] omni example gesture startup")
-        self._line = RegisterScene(LineManipulator, "Line Gesture")
+        # The gesture manager is owned by the extension so it is released on shutdown
+        self._manager = Manager()
+        self._line = RegisterScene(partial(LineManipulator, manager=self._manager), "Line Gesture")
 
     def on_shutdown(self):
         print("[omni.example.gesture] omni example gesture shutdown")
-        self._line = None
\ No newline at end of file
+        self._line = None
+        self._manager = None
\ No newline at end of file
@@ -110,21 +110,22 @@ class Move(sc.DragGesture):
         self.__transform.transform *= current
 
 
-manager = Manager()
-
-
 class LineManipulator(sc.Manipulator):
     """
     Class that holds a custom Manipulator. Inherits from omni.ui.scene.Manipulator class.
     See more here: https://docs.omniverse.nvidia.com/kit/docs/omni.ui.scene/latest/omni.ui.scene/omni.ui.scene.Manipulator.html
     """
 
-    def __init__(self, desc: dict, **kwargs) -> None:
+    def __init__(self, desc: dict, manager: Manager = None, **kwargs) -> None:
         """
         ### Arguments:
             `desc : dict`
                 Description of the manipulator
 
+            `manager : Manager`
+                The gesture manager of the line. It's owned by the extension so it's released on shutdown.
+                A new one is created if it's not passed.
+
             `kwargs : dict`
                 See below
 
@@ -137,6 +138,7 @@ class LineManipulator(sc.Manipulator):
                 The model of the class.
         """
         super().__init__(**kwargs)
+        self.__manager = manager or Manager()
 
     def on_build(self) -> None:
         """
@@ -144,6 +146,7 @@ class LineManipulator(sc.Manipulator):
         Consists of a beige line that stretches in the X-axis.
         Called when Manipulator is dirty to build the content. It's another way to build the manipulator's content on the case the user doesn't want to reimplement the class.
         """
+        manager = self.__manager
         transform = sc.Transform()
         with transform:
             sc.Line(
@@ -0,0 +1,198 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+import numpy as np
+
+
+def _to_matrix(values) -> np.ndarray:
+    """
+    Converts the 16 floats of an `omni.ui.scene` matrix to a 4x4 array.
+
+    `omni.ui.scene` multiplies row vectors by matrices (`point * matrix`), so the
+    translation lives in the last row and the flat list can be reshaped directly.
+    """
+    return np.asarray(values, dtype=np.float64).reshape(4, 4)
+
+
+def _to_homogeneous(points) -> np.ndarray:
+    """
+    Returns an (N, 4) array with w = 1 for an (N, 3) or (3,) array of points.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    return np.hstack((points, np.ones((points.shape[0], 1))))
+
+
+class CameraMath:
+    """
+    Caches the view and projection matrices of a `sc.CameraModel` and their inverses.
+    The matrices are only read and inverted again when the model reports that its
+    `view` or `projection` item changed, so gestures can convert between screen and
+    world space on every mouse move without redoing the matrix math.
+
+    Screen space is the normalized device coordinates of the SceneView, i.e. [-1, 1]
+    on both axes, which is what `omni.ui.scene` reports for the mouse position.
+    The letterboxing added by `sc.AspectRatioPolicy.PRESERVE_ASPECT_FIT` isn't taken into account, so for
+    windows that aren't square the screen space results are off along the letterboxed axis.
+    See more here: https://docs.omniverse.nvidia.com/kit/docs/omni.ui.scene/latest/omni.ui.scene/omni.ui.scene.CameraModel.html
+    """
+
+    def __init__(self, model) -> None:
+        """
+        ### Arguments:
+            `model : sc.CameraModel`
+                The camera model of the SceneView. Its `view` and `projection` items are tracked.
+        """
+        self.__model = model
+        self.__dirty = True
+        self.__view = None
+        self.__projection = None
+        self.__view_projection = None
+        self.__inverse_view = None
+        self.__inverse_projection = None
+        self.__inverse_view_projection = None
+        self.__subscription = model.add_item_changed_fn(self._on_item_changed)
+
+    def destroy(self) -> None:
+        """
+        Stops tracking the camera model.
+        """
+        if self.__model is not None and self.__subscription is not None:
+            self.__model.remove_item_changed_fn(self.__subscription)
+        self.__subscription = None
+        self.__model = None
+
+    @property
+    def model(self):
+        """The tracked `sc.CameraModel`."""
+        return self.__model
+
+    def _on_item_changed(self, model, item) -> None:
+        """
+        Called by the camera model when any of its items changes. Marks the cache as stale.
+        """
+        self.__dirty = True
+
+    def invalidate(self) -> None:
+        """
+        Forces the matrices to be read from the model on next use.
+        """
+        self.__dirty = True
+
+    def _update(self) -> None:
+        """
+        Reads the matrices from the model and recomputes the derived ones if the cache is stale.
+        """
+        if not self.__dirty:
+            return
+        model = self.__model
+        self.__view = _to_matrix(model.get_as_floats(model.get_item("view")))
+        self.__projection = _to_matrix(model.get_as_floats(model.get_item("projection")))
+        self.__view_projection = self.__view @ self.__projection
+        self.__inverse_view = np.linalg.inv(self.__view)
+        self.__inverse_projection = np.linalg.inv(self.__projection)
+        self.__inverse_view_projection = np.linalg.inv(self.__view_projection)
+        self.__dirty = False
+
+    @property
+    def view(self) -> np.ndarray:
+        """The 4x4 view matrix."""
+        self._update()
+        return self.__view
+
+    @property
+    def projection(self) -> np.ndarray:
+        """The 4x4 projection matrix."""
+        self._update()
+        return self.__projection
+
+    @property
+    def view_projection(self) -> np.ndarray:
+        """The 4x4 matrix that transforms world space to clip space."""
+        self._update()
+        return self.__view_projection
+
+    @property
+    def inverse_view(self) -> np.ndarray:
+        """The inverse of the view matrix."""
+        self._update()
+        return self.__inverse_view
+
+    @property
+    def inverse_projection(self) -> np.ndarray:
+        """The inverse of the projection matrix."""
+        self._update()
+        return self.__inverse_projection
+
+    @property
+    def inverse_view_projection(self) -> np.ndarray:
+        """The 4x4 matrix that transforms clip space to world space."""
+        self._update()
+        return self.__inverse_view_projection
+
+    def project(self, points) -> np.ndarray:
+        """
+        Projects world space points to screen space.
+
+        Args:
+            `points : array-like`
+                A single point (3,) or many points (N, 3) in world space.
+
+        Returns:
+            np.ndarray: (N, 3) array of screen space points. The third column is the depth.
+        """
+        clip = _to_homogeneous(points) @ self.view_projection
+        return clip[:, :3] / clip[:, 3:]
+
+    def unproject(self, points) -> np.ndarray:
+        """
+        Unprojects screen space points to world space.
+
+        Args:
+            `points : array-like`
+                A single point (3,) or many points (N, 3) in screen space. The third column is the depth.
+
+        Returns:
+            np.ndarray: (N, 3) array of world space points.
+        """
+        world = _to_homogeneous(points) @ self.inverse_view_projection
+        return world[:, :3] / world[:, 3:]
+
+    def screen_to_world_delta(self, delta, anchor) -> np.ndarray:
+        """
+        Converts a screen space movement to a world space movement.
+        The movement is measured at the depth of `anchor`, so an object under the mouse follows it exactly.
+
+        Args:
+            `delta : array-like`
+                The (x, y) screen space movement.
+            `anchor : array-like`
+                The world space point where the movement starts.
+
+        Returns:
+            np.ndarray: The (3,) world space movement.
+        """
+        start = self.project(anchor)
+        end = start.copy()
+        end[:, :2] += np.asarray(delta, dtype=np.float64)[:2]
+        world = self.unproject(np.vstack((start, end)))
+        return world[1] - world[0]
+
+    def visible(self, points) -> np.ndarray:
+        """
+        Checks which world space points project inside the screen and are in front of the camera.
+        Useful for picking and culling.
+
+        Args:
+            `points : array-like`
+                A single point (3,) or many points (N, 3) in world space.
+
+        Returns:
+            np.ndarray: (N,) boolean array, True where the point is visible.
+        """
+        clip = _to_homogeneous(points) @ self.view_projection
+        w = clip[:, 3:]
+        return np.all(np.abs(clip[:, :2]) <= w, axis=1) & (w[:, 0] > 0)
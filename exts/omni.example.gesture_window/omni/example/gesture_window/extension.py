@@ -7,7 +7,7 @@
 # license agreement from NVIDIA CORPORATION is strictly prohibited. 
 
 import omni.ext
-from .window import GestureWindowExample
+from .window import GestureWindowExample, Manager
 
 
 # Any class derived from `omni.ext.IExt` in top level module (defined in `python.modules` of `extension.toml`) will be
@@ -18,11 +18,13 @@ class OmniExampleGestureExtension(omni.ext.IExt):
     # this extension is located on filesystem.
     def on_startup(self, ext_id):
         print("[omni.example.gesture] omni example gesture startup")
-        self._window = GestureWindowExample("Gesture Example", width=500, height=500)
-
+        # The gesture manager is owned by the extension so it is released on shutdown
+        self._manager = Manager()
+        self._window = GestureWindowExample("Gesture Example", manager=self._manager, width=500, height=500)
 
     def on_shutdown(self):
         print("[omni.example.gesture] omni example gesture shutdown")
         if self._window:
             self._window.destroy()
         self._window = None
+        self._manager = None
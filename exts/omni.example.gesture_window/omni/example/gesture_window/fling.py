@@ -0,0 +1,169 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+import math
+
+import numpy as np
+
+
+class FlingIntegrator:
+    """
+    Keeps shapes moving after a drag is released and slows them down until they stop.
+
+    All the flinging shapes are advanced together with one vectorized update per frame. The simulation runs with a
+    fixed timestep, so the result only depends on the sum of the frame times and not on how they are split,
+    which makes it deterministic and easy to test.
+    """
+
+    def __init__(
+        self,
+        timestep: float = 1 / 120,
+        friction: float = 4.0,
+        min_speed: float = 0.05,
+        max_steps: int = 8,
+        axes: int = 3,
+    ) -> None:
+        """
+        ### Arguments:
+            `timestep : float`
+                The duration of one simulation step in seconds.
+
+            `friction : float`
+                How fast the shapes slow down. The velocity is multiplied by `exp(-friction * t)` after `t` seconds.
+
+            `min_speed : float`
+                A shape stops once its speed gets below this value. Must be positive, otherwise a decelerating
+                shape would never stop.
+
+            `max_steps : int`
+                The maximum number of steps per update. Longer frames are dropped instead of simulated.
+
+            `axes : int`
+                The number of components of the velocities.
+        """
+        if min_speed <= 0:
+            raise ValueError(f"min_speed must be positive, got {min_speed}")
+        self.timestep = timestep
+        self.min_speed = min_speed
+        self.max_steps = max_steps
+        self.__decay = math.exp(-friction * timestep)
+        self.__axes = axes
+        self.__velocities = np.zeros((0, axes))
+        self.__remaining = np.zeros(0, dtype=np.int64)
+        self.__keys = []
+        self.__callbacks = []
+        self.__accumulator = 0.0
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self.__keys
+
+    def start(self, key, velocity, callback) -> None:
+        """
+        Starts flinging a shape. A fling that is already running for `key` is replaced.
+
+        Args:
+            `key : hashable`
+                The identifier of the shape.
+            `velocity : sequence of float`
+                The initial velocity in units per second.
+            `callback : callable`
+                Called with the (axes,) displacement of the shape every update it moves.
+        """
+        self.stop(key)
+        velocity = np.zeros(self.__axes) + np.asarray(velocity, dtype=np.float64)[: self.__axes]
+        speed = np.linalg.norm(velocity)
+        if speed < self.min_speed:
+            return
+        # The number of steps until the speed drops below `min_speed`, known upfront so the stop is frame independent
+        if self.__decay < 1:
+            remaining = int(math.log(self.min_speed / speed) / math.log(self.__decay)) + 1
+        else:
+            remaining = np.iinfo(np.int64).max
+        self.__velocities = np.vstack((self.__velocities, velocity))
+        self.__remaining = np.append(self.__remaining, remaining)
+        self.__keys.append(key)
+        self.__callbacks.append(callback)
+
+    def stop(self, key) -> None:
+        """
+        Stops flinging a shape, for example when it's grabbed again.
+        """
+        if key in self.__keys:
+            self._keep(np.array([k != key for k in self.__keys], dtype=bool))
+
+    def clear(self) -> None:
+        """
+        Stops all the flings.
+        """
+        self._keep(np.zeros(len(self.__keys), dtype=bool))
+        self.__accumulator = 0.0
+
+    def velocity(self, key) -> np.ndarray:
+        """
+        Returns the current velocity of a flinging shape.
+        """
+        return self.__velocities[self.__keys.index(key)].copy()
+
+    def _keep(self, mask: np.ndarray) -> None:
+        """
+        Drops the flings where `mask` is False.
+        """
+        self.__velocities = self.__velocities[mask]
+        self.__remaining = self.__remaining[mask]
+        self.__keys = [key for key, keep in zip(self.__keys, mask) if keep]
+        self.__callbacks = [callback for callback, keep in zip(self.__callbacks, mask) if keep]
+
+    def advance(self, elapsed: float) -> np.ndarray:
+        """
+        Runs as many fixed steps as fit in the elapsed time plus the time left over from the previous call.
+        Every shape stops after the step its speed drops below `min_speed`.
+        Doesn't call the callbacks and doesn't drop the stopped shapes.
+
+        Args:
+            `elapsed : float`
+                The time since the previous call in seconds.
+
+        Returns:
+            np.ndarray: (N, axes) displacement of every flinging shape, in the order they were started.
+        """
+        self.__accumulator += elapsed
+        steps = int(self.__accumulator / self.timestep)
+        self.__accumulator -= steps * self.timestep
+        steps = min(steps, self.max_steps)
+        if steps == 0 or not self.__keys:
+            return np.zeros_like(self.__velocities)
+        # The velocity decays geometrically, so the displacement of all the steps is a geometric series
+        steps = np.minimum(self.__remaining, steps)
+        decay = self.__decay
+        factor = decay ** steps.astype(np.float64)
+        total = (1 - factor) / (1 - decay) if decay < 1 else steps.astype(np.float64)
+        displacement = self.__velocities * (self.timestep * total)[:, np.newaxis]
+        self.__velocities *= factor[:, np.newaxis]
+        self.__remaining -= steps
+        return displacement
+
+    def update(self, elapsed: float) -> None:
+        """
+        Advances all the flings, calls the callbacks of the shapes that moved and drops the shapes that stopped.
+        Should be called once per frame.
+
+        Args:
+            `elapsed : float`
+                The frame time in seconds.
+        """
+        if not self.__keys:
+            self.__accumulator = 0.0
+            return
+        displacement = self.advance(elapsed)
+        moved = np.any(displacement != 0, axis=1)
+        callbacks = self.__callbacks
+        self._keep(self.__remaining > 0)
+        for index in np.flatnonzero(moved):
+            callbacks[index](displacement[index])
@@ -0,0 +1,159 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+from bisect import bisect_left
+
+
+class _Axis:
+    """
+    The snap targets of one axis: the edges and centers of all the shapes, kept sorted.
+    `owners` is parallel to `values` so the targets of the shape being snapped can be skipped.
+    """
+
+    def __init__(self) -> None:
+        self.values = []
+        self.owners = []
+
+    def insert(self, value: float, owner) -> None:
+        index = bisect_left(self.values, value)
+        self.values.insert(index, value)
+        self.owners.insert(index, owner)
+
+    def remove(self, value: float, owner) -> None:
+        index = bisect_left(self.values, value)
+        while self.owners[index] != owner:
+            index += 1
+        del self.values[index]
+        del self.owners[index]
+
+    def nearest(self, value: float, exclude):
+        """
+        Returns the target closest to `value` that isn't owned by `exclude`, or None if there is no such target.
+        """
+        values = self.values
+        owners = self.owners
+        right = bisect_left(values, value)
+        left = right - 1
+        while left >= 0 and owners[left] == exclude:
+            left -= 1
+        while right < len(values) and owners[right] == exclude:
+            right += 1
+        if left < 0:
+            return values[right] if right < len(values) else None
+        if right >= len(values):
+            return values[left]
+        return values[left] if value - values[left] <= values[right] - value else values[right]
+
+
+class SnapEngine:
+    """
+    Snaps dragged shapes to a grid and to the edges and centers of the other shapes.
+
+    The snap targets of every axis are kept in sorted lists that are updated incrementally when a shape moves,
+    so finding the nearest target is a binary search and stays fast with thousands of shapes.
+    Shapes are axis aligned boxes identified by any hashable key.
+    """
+
+    def __init__(self, grid: float = 0.0, threshold: float = 0.1, axes: int = 2) -> None:
+        """
+        ### Arguments:
+            `grid : float`
+                The grid spacing. Centers snap to multiples of it. 0 disables grid snapping.
+
+            `threshold : float`
+                The maximum distance a shape is moved to reach a snap target.
+
+            `axes : int`
+                The number of axes that are snapped, starting from X.
+        """
+        self.grid = grid
+        self.threshold = threshold
+        self.__axes = [_Axis() for _ in range(axes)]
+        self.__shapes = {}
+
+    @staticmethod
+    def _targets(center, half_size):
+        """
+        Returns the edges and the center of a shape per axis.
+        """
+        return [(c - h, c, c + h) for c, h in zip(center, half_size)]
+
+    def add_shape(self, key, center, half_size) -> None:
+        """
+        Registers a shape so the other shapes snap to it.
+
+        Args:
+            `key : hashable`
+                The identifier of the shape.
+            `center : sequence of float`
+                The center of the shape.
+            `half_size : sequence of float`
+                Half of the shape size along every axis.
+        """
+        if key in self.__shapes:
+            self.remove_shape(key)
+        center = tuple(center[: len(self.__axes)])
+        half_size = tuple(half_size[: len(self.__axes)])
+        self.__shapes[key] = (center, half_size)
+        for axis, targets in zip(self.__axes, self._targets(center, half_size)):
+            for value in targets:
+                axis.insert(value, key)
+
+    def remove_shape(self, key) -> None:
+        """
+        Unregisters a shape.
+        """
+        center, half_size = self.__shapes.pop(key)
+        for axis, targets in zip(self.__axes, self._targets(center, half_size)):
+            for value in targets:
+                axis.remove(value, key)
+
+    def move_shape(self, key, center) -> None:
+        """
+        Updates the snap targets of a shape that was moved.
+        """
+        _, half_size = self.__shapes[key]
+        self.remove_shape(key)
+        self.add_shape(key, center, half_size)
+
+    def center(self, key) -> tuple:
+        """
+        Returns the registered center of a shape.
+        """
+        return self.__shapes[key][0]
+
+    def snap(self, key, center) -> tuple:
+        """
+        Finds where the shape should be placed when it's dragged to `center`.
+        The shape snaps independently on every axis, using whichever of its edges or center is closest to a target.
+
+        Args:
+            `key : hashable`
+                The identifier of the dragged shape. Its own targets are ignored.
+            `center : sequence of float`
+                The unsnapped center of the shape.
+
+        Returns:
+            tuple: The snapped center.
+        """
+        _, half_size = self.__shapes[key]
+        result = []
+        for axis, c, h in zip(self.__axes, center, half_size):
+            best = None
+            if self.grid > 0:
+                best = round(c / self.grid) * self.grid - c
+            for offset in (-h, 0.0, h):
+                target = axis.nearest(c + offset, key)
+                if target is None:
+                    continue
+                shift = target - c - offset
+                if best is None or abs(shift) < abs(best):
+                    best = shift
+            if best is not None and abs(best) <= self.threshold:
+                c += best
+            result.append(c)
+        return tuple(result)
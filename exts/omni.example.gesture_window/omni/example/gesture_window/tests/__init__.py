@@ -5,4 +5,7 @@
 # and any modifications thereto.  Any use, reproduction, disclosure or
 # distribution of this software and related documentation without an express
 # license agreement from NVIDIA CORPORATION is strictly prohibited. 
-from .test_hello_world import *
\ No newline at end of file
+from .test_hello_world import *
+from .test_camera import *
+from .test_snapping import *
+from .test_fling import *
\ No newline at end of file
@@ -0,0 +1,51 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+import numpy as np
+import omni.kit.test
+from omni.ui import scene as sc
+
+from omni.example.gesture_window.camera import CameraMath
+from omni.example.gesture_window.window import proj
+
+
+class TestCameraMath(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.model = sc.CameraModel(proj, 1)
+        self.camera = CameraMath(self.model)
+
+    async def tearDown(self):
+        self.camera.destroy()
+        self.camera = None
+        self.model = None
+
+    async def test_project_unproject_roundtrip(self):
+        points = np.random.default_rng(0).uniform(-5, 5, (1000, 3))
+        result = self.camera.unproject(self.camera.project(points))
+        np.testing.assert_allclose(result, points, atol=1e-6)
+
+    async def test_matrices_are_cached(self):
+        first = self.camera.inverse_view_projection
+        self.camera.project([0, 0, 0])
+        self.assertIs(self.camera.inverse_view_projection, first)
+
+    async def test_model_change_recomputes(self):
+        first = self.camera.projection
+        doubled = [value * 2 for value in proj]
+        doubled[15] = 1
+        self.model.set_floats(self.model.get_item("projection"), doubled)
+        self.assertIsNot(self.camera.projection, first)
+        self.assertAlmostEqual(self.camera.projection[0, 0], 1.0)
+
+    async def test_screen_to_world_delta(self):
+        # The projection scales x and y by 0.5, so a screen movement maps to twice the world movement
+        delta = self.camera.screen_to_world_delta((0.1, -0.2), (1, 1, 0))
+        np.testing.assert_allclose(delta, [0.2, -0.4, 0], atol=1e-6)
+
+    async def test_visible(self):
+        visible = self.camera.visible([[0, 0, 0], [1.5, 0, 0], [3, 0, 0]])
+        self.assertEqual(visible.tolist(), [True, True, False])
@@ -0,0 +1,107 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+import time
+
+import numpy as np
+import omni.kit.test
+from omni.ui import scene as sc
+
+from omni.example.gesture_window.fling import FlingIntegrator
+from omni.example.gesture_window.window import Move
+
+
+class TestFlingIntegrator(omni.kit.test.AsyncTestCase):
+    async def test_decelerates_and_stops(self):
+        integrator = FlingIntegrator(timestep=0.01, friction=5.0, min_speed=0.01)
+        moves = []
+        integrator.start("a", (1.0, 0.0, 0.0), moves.append)
+        for _ in range(500):
+            integrator.update(0.01)
+        self.assertEqual(len(integrator), 0)
+        steps = [move[0] for move in moves]
+        self.assertTrue(all(a > b for a, b in zip(steps, steps[1:])))
+        # The total distance approaches velocity / friction
+        self.assertAlmostEqual(sum(steps), 0.2, delta=0.01)
+
+    async def test_independent_of_frame_split(self):
+        positions = []
+        for frames in ([1 / 30] * 30, [1 / 60] * 60, [0.005, 0.03] * 28 + [0.02]):
+            integrator = FlingIntegrator(timestep=1 / 120, max_steps=100)
+            position = np.zeros(3)
+
+            def on_fling(displacement):
+                position[:] += displacement
+
+            integrator.start("a", (2.0, -1.0, 0.0), on_fling)
+            for elapsed in frames:
+                integrator.update(elapsed)
+            positions.append(position.copy())
+        np.testing.assert_allclose(positions[0], positions[1], atol=1e-9)
+        np.testing.assert_allclose(positions[0], positions[2], atol=1e-9)
+
+    async def test_start_replaces_and_stop_removes(self):
+        integrator = FlingIntegrator()
+        integrator.start("a", (1, 0, 0), lambda d: None)
+        integrator.start("a", (0, 3, 0), lambda d: None)
+        self.assertEqual(len(integrator), 1)
+        np.testing.assert_allclose(integrator.velocity("a"), [0, 3, 0])
+        integrator.stop("a")
+        self.assertNotIn("a", integrator)
+        integrator.start("b", (0.001, 0, 0), lambda d: None)
+        self.assertNotIn("b", integrator)
+
+    async def test_many_flings(self):
+        rng = np.random.default_rng(0)
+        integrator = FlingIntegrator()
+        calls = [0]
+
+        def on_fling(displacement):
+            calls[0] += 1
+
+        for i in range(5000):
+            integrator.start(i, rng.uniform(-10, 10, 3), on_fling)
+
+        for _ in range(10):
+            integrator.update(1 / 60)
+        self.assertEqual(calls[0], 50000)
+
+    async def test_min_speed_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            FlingIntegrator(min_speed=0)
+
+
+class TestMoveFling(omni.kit.test.AsyncTestCase):
+    async def test_release_starts_fling(self):
+        integrator = FlingIntegrator()
+        transform = sc.Transform()
+        move = Move(transform, fling=integrator)
+
+        move.on_began()
+        for _ in range(10):
+            time.sleep(0.005)
+            move._drag((0.03, 0.0, 0.0))
+        move.on_ended()
+        self.assertIn(move, integrator)
+        self.assertGreater(integrator.velocity(move)[0], 0)
+
+        released = transform.transform[12]
+        self.assertAlmostEqual(released, 0.3, places=5)
+        integrator.update(0.1)
+        self.assertGreater(transform.transform[12], released)
+
+    async def test_fling_stops_at_bounds(self):
+        integrator = FlingIntegrator()
+        transform = sc.Transform()
+        move = Move(transform, fling=integrator, fling_bounds=((-1, -1), (1, 1)))
+
+        integrator.start(move, (20.0, -20.0, 0.0), move._on_fling)
+        for _ in range(120):
+            integrator.update(1 / 60)
+        self.assertNotIn(move, integrator)
+        self.assertAlmostEqual(transform.transform[12], 1.0, places=5)
+        self.assertAlmostEqual(transform.transform[13], -1.0, places=5)
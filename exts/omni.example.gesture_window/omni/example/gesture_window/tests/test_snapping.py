@@ -0,0 +1,65 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+import random
+
+import omni.kit.test
+
+from omni.example.gesture_window.snapping import SnapEngine
+
+
+class TestSnapEngine(omni.kit.test.AsyncTestCase):
+    async def test_snap_to_grid(self):
+        engine = SnapEngine(grid=0.5, threshold=0.1)
+        engine.add_shape("a", (0, 0), (0.2, 0.2))
+        self.assertEqual(engine.snap("a", (0.93, 2.2)), (1.0, 2.2))
+
+    async def test_snap_edge_to_edge(self):
+        engine = SnapEngine(threshold=0.1)
+        engine.add_shape("a", (0, 0), (1, 1))
+        engine.add_shape("b", (5, 5), (1, 1))
+        # The left edge of "b" at 1.05 snaps to the right edge of "a" at 1
+        self.assertEqual(engine.snap("b", (2.05, 5)), (2.0, 5))
+
+    async def test_ignores_own_targets(self):
+        engine = SnapEngine(threshold=0.1)
+        engine.add_shape("a", (0, 0), (1, 1))
+        self.assertEqual(engine.snap("a", (0.05, 0.05)), (0.05, 0.05))
+
+    async def test_move_shape_updates_targets(self):
+        engine = SnapEngine(threshold=0.1)
+        engine.add_shape("a", (0, 0), (1, 1))
+        engine.add_shape("b", (10, 10), (1, 1))
+        engine.move_shape("a", (3, 3))
+        self.assertEqual(engine.center("a"), (3, 3))
+        self.assertEqual(engine.snap("b", (3.05, 10)), (3, 10))
+        self.assertEqual(engine.snap("b", (0.05, 10)), (0.05, 10))
+
+    async def test_many_shapes_match_brute_force(self):
+        rng = random.Random(0)
+        engine = SnapEngine(grid=0.5, threshold=0.1)
+        shapes = {i: (rng.uniform(-100, 100), rng.uniform(-100, 100)) for i in range(5000)}
+        for key, center in shapes.items():
+            engine.add_shape(key, center, (1, 1))
+
+        for _ in range(50):
+            center = (rng.uniform(-100, 100), rng.uniform(-100, 100))
+            expected = []
+            for axis, c in enumerate(center):
+                shifts = [round(c / 0.5) * 0.5 - c]
+                for key, other in shapes.items():
+                    if key == 0:
+                        continue
+                    for target in (other[axis] - 1, other[axis], other[axis] + 1):
+                        shifts += [target - c - offset for offset in (-1, 0, 1)]
+                best = min(shifts, key=abs)
+                expected.append(c + best if abs(best) <= 0.1 else c)
+            snapped = engine.snap(0, center)
+            for value, reference in zip(snapped, expected):
+                self.assertAlmostEqual(value, reference)
+            engine.move_shape(0, snapped)
+            shapes[0] = snapped
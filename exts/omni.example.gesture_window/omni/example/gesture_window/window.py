@@ -5,12 +5,27 @@
 # and any modifications thereto.  Any use, reproduction, disclosure or
 # distribution of this software and related documentation without an express
 # license agreement from NVIDIA CORPORATION is strictly prohibited.
+import time
+import weakref
+
+import omni.kit.app
 import omni.ui as ui
 from omni.ui import scene as sc
 from omni.ui_scene._scene import AbstractGesture
 
+from .fling import FlingIntegrator
+from .snapping import SnapEngine
+
 proj = [0.5, 0, 0, 0, 0, 0.5, 0, 0, 0, 0, 2e-7, 0, 0, 0, 1, 1]
 
+# Size and start position of the rectangles, shared by the drawn shapes and their snap targets
+RECT_SIZE = 2
+BEIGE_POSITION = (0, 0, 0)
+OLIVE_POSITION = (0, 0, -1)
+# Half of the scene width visible through `proj`. Flung rectangles stay fully inside it
+SCENE_EXTENT = 1 / proj[0]
+FLING_LIMIT = SCENE_EXTENT - RECT_SIZE / 2
+
 
 def setcolor(sender, color):
     """
@@ -25,6 +40,30 @@ def setcolor(sender, color):
     sender.color = color
 
 
+def weak_callback(method, *args):
+    """
+    Wraps a bound method in a gesture callback that doesn't keep the method's object alive.
+    Lambdas that capture `self` would keep the window alive for as long as the gesture lives.
+
+    Args:
+        `method : bound method`
+            The method to call with the sender followed by `args`
+        `args :`
+            Extra arguments passed to the method
+
+    Returns:
+        A callback that takes the sender. It does nothing once the method's object is deleted.
+    """
+    ref = weakref.WeakMethod(method)
+
+    def callback(sender):
+        bound = ref()
+        if bound is not None:
+            bound(sender, *args)
+
+    return callback
+
+
 class Manager(sc.GestureManager):
     """
     The object that controls batch processing and preventing of gestures.
@@ -50,22 +89,36 @@ class Manager(sc.GestureManager):
             return True
 
 
-manager = Manager()
-
-
 class Move(sc.DragGesture):
     """
     Inherits from `DragGesture`, the gesture that provides a way to capture click-and-drag mouse event.
     See more here: https://docs.omniverse.nvidia.com/kit/docs/omni.ui.scene/latest/omni.ui.scene/omni.ui.scene.DragGesture.html
     """
 
-    def __init__(self, transform: sc.Transform, **kwargs):
+    def __init__(
+        self,
+        transform: sc.Transform,
+        snap: SnapEngine = None,
+        snap_key=None,
+        fling: FlingIntegrator = None,
+        fling_bounds=None,
+        **kwargs,
+    ):
         """
         Construct the gesture to track mouse drags
 
         Args:
             `transform : sc.Transform` The transform parent of the shape.
 
+            `snap : SnapEngine` Optional snapping engine the dragged shape snaps with.
+
+            `snap_key : ` The key the shape is registered with in `snap`.
+
+            `fling : FlingIntegrator` Optional integrator that keeps the shape moving after the drag is released.
+
+            `fling_bounds : ` Optional `(minimum, maximum)` corners of the box the transform's translation stays in
+                while flinging. The fling stops when the shape reaches the box.
+
             `kwargs : dict`
                 See below
 
@@ -101,12 +154,97 @@ class Move(sc.DragGesture):
         """
         super().__init__(**kwargs)
         self.__transform = transform
+        self.__snap = snap
+        self.__snap_key = snap_key
+        self.__raw_center = None
+        self.__fling = fling
+        self.__fling_bounds = fling_bounds
+        self.__velocity = [0.0, 0.0, 0.0]
+        self.__last_time = 0.0
+
+    def on_began(self):
+        """
+        Called when the user clicks the mouse button. Stops the fling of the shape and remembers where it starts
+        when snapping.
+        """
+        if self.__fling is not None:
+            self.__fling.stop(self)
+            self.__velocity = [0.0, 0.0, 0.0]
+            self.__last_time = time.perf_counter()
+        if self.__snap is not None:
+            self.__raw_center = list(self.__snap.center(self.__snap_key))
 
     def on_changed(self):
         """
         Called when the user moves the clicked button. Moves the sender in the direction the mouse was moved.
         """
-        translate = self.sender.gesture_payload.moved
+        self._drag(self.sender.gesture_payload.moved)
+
+    def _drag(self, moved):
+        """
+        Moves the shape by the mouse movement `moved`, tracking the fling velocity and snapping when enabled.
+        """
+        translate = list(moved)
+        if self.__fling is not None:
+            self._track_velocity(translate)
+        if self.__snap is not None:
+            # Track the unsnapped position so the shape can leave a snap target once the mouse moves far enough
+            for i in range(len(self.__raw_center)):
+                self.__raw_center[i] += translate[i]
+            previous = self.__snap.center(self.__snap_key)
+            snapped = self.__snap.snap(self.__snap_key, self.__raw_center)
+            self.__snap.move_shape(self.__snap_key, snapped)
+            for i in range(len(snapped)):
+                translate[i] = snapped[i] - previous[i]
+        self._translate(translate)
+
+    def on_ended(self):
+        """
+        Called when the user releases the mouse button. Flings the shape with the velocity of the drag.
+        """
+        if self.__fling is None:
+            return
+        # The mouse was held still before the release
+        if time.perf_counter() - self.__last_time > 0.1:
+            return
+        self.__fling.start(self, self.__velocity, self._on_fling)
+
+    def _track_velocity(self, translate):
+        """
+        Smooths the drag velocity over the last few mouse moves.
+        """
+        now = time.perf_counter()
+        elapsed = now - self.__last_time
+        self.__last_time = now
+        if elapsed <= 0:
+            return
+        for i in range(len(self.__velocity)):
+            self.__velocity[i] = 0.5 * self.__velocity[i] + 0.5 * translate[i] / elapsed
+
+    def _on_fling(self, displacement):
+        """
+        Called by the fling integrator every frame the shape moves after the release.
+        """
+        translate = [float(value) for value in displacement]
+        if self.__fling_bounds is not None:
+            minimum, maximum = self.__fling_bounds
+            matrix = self.__transform.transform
+            for i in range(len(minimum)):
+                position = matrix[12 + i]
+                clamped = min(max(position + translate[i], minimum[i]), maximum[i])
+                if clamped != position + translate[i]:
+                    # Stop at the edge instead of leaving the scene where the shape can't be grabbed back
+                    self.__fling.stop(self)
+                translate[i] = clamped - position
+        if self.__snap is not None:
+            center = self.__snap.center(self.__snap_key)
+            self.__snap.move_shape(self.__snap_key, [c + t for c, t in zip(center, translate)])
+        self._translate(translate)
+
+    def _translate(self, translate):
+        """
+        Moves the transform by `translate`.
+        """
         # Move transform to the direction mouse moved
         current = sc.Matrix44.get_translation_matrix(*translate)
         self.__transform.transform *= current
@@ -120,7 +258,7 @@ class GestureWindowExample(ui.Window):
     See more here: https://docs.omniverse.nvidia.com/kit/docs/omni.ui/latest/omni.ui/omni.ui.Window.html
     """
 
-    def __init__(self, title: str, **kwargs) -> None:
+    def __init__(self, title: str, manager: Manager = None, **kwargs) -> None:
         """
         Construct the window, add it to the underlying windowing system, and makes it appear.
 
@@ -129,6 +267,10 @@ class GestureWindowExample(ui.Window):
             `title :`
                 The window title. It's also used as an internal window ID.
 
+            `manager : Manager`
+                The gesture manager of the beige rectangle. It's owned by the extension so it's released on shutdown.
+                A new one is created if it's not passed.
+
             `kwargs : dict`
                 See below
 
@@ -181,24 +323,50 @@ class GestureWindowExample(ui.Window):
         """
         super().__init__(title, **kwargs)
         self.label = None
+        self.manager = manager or Manager()
+        # Both rectangles snap to a grid and to each other's edges and centers while dragged
+        self.snap = SnapEngine(grid=0.5, threshold=0.1)
+        # Both rectangles keep moving after they are released, all the flings advance together once per frame
+        self.fling = FlingIntegrator()
+        self._update_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(weak_callback(self._on_update), name="gesture window fling")
+        )
         self.frame.set_build_fn(self._build_fn)
 
+    def destroy(self) -> None:
+        """
+        Releases the flings and the gesture manager and destroys the window.
+        """
+        self._update_sub = None
+        self.fling.clear()
+        self.manager = None
+        super().destroy()
+
     def _build_fn(self):
         """
         The callback that will be called once the frame is visible and the content of the callback will override the frame child. It's useful for lazy load.
         """
+        manager = self.manager
+        # The rebuilt rectangles start at the origin
+        self.fling.clear()
         with self.frame:
             with ui.VStack():
                 self.label = ui.Label("Sender: None\nAction: None", alignment=ui.Alignment.CENTER, size=16)
                 scene_view = sc.SceneView(
                     sc.CameraModel(proj, 1), aspect_ratio_policy=sc.AspectRatioPolicy.PRESERVE_ASPECT_FIT
                 )
+                half_size = (RECT_SIZE / 2, RECT_SIZE / 2)
+                fling_bounds = ((-FLING_LIMIT, -FLING_LIMIT), (FLING_LIMIT, FLING_LIMIT))
+                self.snap.add_shape("beige", BEIGE_POSITION[:2], half_size)
+                self.snap.add_shape("olive", OLIVE_POSITION[:2], half_size)
                 with scene_view.scene:
-                    transform = sc.Transform()
+                    transform = sc.Transform(transform=sc.Matrix44.get_translation_matrix(*BEIGE_POSITION))
                     with transform:
                         sc.Rectangle(
-                            2,
-                            2,
+                            RECT_SIZE,
+                            RECT_SIZE,
                             color=ui.color.beige,
                             thickness=5,
                             gestures=[
@@ -208,33 +376,53 @@ class GestureWindowExample(ui.Window):
                                 sc.DoubleClickGesture(
                                     lambda s: setcolor(s, ui.color.beige), manager=manager, name="gesture_name"
                                 ),
-                                Move(transform, manager=manager, name="gesture_name"),
+                                Move(
+                                    transform,
+                                    snap=self.snap,
+                                    snap_key="beige",
+                                    fling=self.fling,
+                                    fling_bounds=fling_bounds,
+                                    manager=manager,
+                                    name="gesture_name",
+                                ),
                                 sc.HoverGesture(
                                     on_began_fn=lambda s: setcolor(s, ui.color.black),
-                                    on_changed_fn=lambda s: self.print_action(s, "Hover Changed"),
-                                    on_ended_fn=lambda s: self.print_action(s, "Hover End"),
+                                    on_changed_fn=weak_callback(self.print_action, "Hover Changed"),
+                                    on_ended_fn=weak_callback(self.print_action, "Hover End"),
                                 ),
                             ],
                         )
-                    transform = sc.Transform(transform=sc.Matrix44.get_translation_matrix(0, 0, -1))
+                    transform = sc.Transform(transform=sc.Matrix44.get_translation_matrix(*OLIVE_POSITION))
                     with transform:
                         sc.Rectangle(
-                            2,
-                            2,
+                            RECT_SIZE,
+                            RECT_SIZE,
                             color=ui.color.olive,
                             thickness=5,
                             gestures=[
                                 sc.ClickGesture(lambda s: setcolor(s, ui.color.red)),
                                 sc.DoubleClickGesture(lambda s: setcolor(s, ui.color.olive)),
-                                Move(transform),
+                                Move(
+                                    transform,
+                                    snap=self.snap,
+                                    snap_key="olive",
+                                    fling=self.fling,
+                                    fling_bounds=fling_bounds,
+                                ),
                                 sc.HoverGesture(
                                     on_began_fn=lambda s: setcolor(s, ui.color.black),
-                                    on_changed_fn=lambda s: self.print_action(s, "Hover Changed"),
-                                    on_ended_fn=lambda s: self.print_action(s, "Hover End"),
+                                    on_changed_fn=weak_callback(self.print_action, "Hover Changed"),
+                                    on_ended_fn=weak_callback(self.print_action, "Hover End"),
                                 ),
                             ],
                         )
 
+    def _on_update(self, event):
+        """
+        Called every frame. Advances the flinging rectangles.
+        """
+        self.fling.update(event.payload["dt"])
+
     def print_action(self, sender, action):
         """
         Prints the action / gesture to the label in the middle of the window
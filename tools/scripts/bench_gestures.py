@@ -0,0 +1,66 @@
+import argparse
+import importlib.util
+import os
+import random
+import time
+
+GESTURE_WINDOW = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    "..",
+    "..",
+    "exts",
+    "omni.example.gesture_window",
+    "omni",
+    "example",
+    "gesture_window",
+)
+
+
+def load(name):
+    # Load the module by path so Kit isn't needed to import the extension package
+    spec = importlib.util.spec_from_file_location(name, os.path.join(GESTURE_WINDOW, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bench_snapping(shapes, events):
+    snapping = load("snapping")
+    rng = random.Random(0)
+    engine = snapping.SnapEngine(grid=0.5, threshold=0.1)
+    for i in range(shapes):
+        engine.add_shape(i, (rng.uniform(-100, 100), rng.uniform(-100, 100)), (1, 1))
+
+    start = time.perf_counter()
+    for _ in range(events):
+        center = (rng.uniform(-100, 100), rng.uniform(-100, 100))
+        engine.move_shape(0, engine.snap(0, center))
+    per_event = (time.perf_counter() - start) / events
+    print(f"snapping: {shapes} shapes, {per_event * 1e6:.1f} us per drag event (snap + move_shape)")
+
+
+def bench_fling(flings, frames):
+    fling = load("fling")
+    rng = random.Random(0)
+    integrator = fling.FlingIntegrator()
+    for i in range(flings):
+        integrator.start(i, (rng.uniform(-10, 10), rng.uniform(-10, 10), 0), lambda displacement: None)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        integrator.update(1 / 60)
+    per_frame = (time.perf_counter() - start) / frames
+    print(f"fling: {flings} simultaneous flings, {per_frame * 1e3:.2f} ms per frame (including callbacks)")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Time the gesture window snapping and fling stages")
+    parser.add_argument("--shapes", type=int, default=5000, help="Number of shapes")
+    parser.add_argument("--events", type=int, default=1000, help="Number of drag events")
+    parser.add_argument("--flings", type=int, default=5000, help="Number of simultaneous flings")
+    parser.add_argument("--frames", type=int, default=10, help="Number of fling frames")
+    args = parser.parse_args()
+
+    bench_snapping(args.shapes, args.events)
+    bench_fling(args.flings, args.frames)
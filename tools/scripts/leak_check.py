@@ -0,0 +1,253 @@
+import argparse
+import contextlib
+import gc
+import importlib
+import os
+import sys
+import types
+import weakref
+from collections import Counter
+
+EXTS_ROOT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..", "exts")
+
+EXTENSIONS = {
+    "omni.example.gesture_window": "OmniExampleGestureExtension",
+    "omni.example.gesture_viewport": "OmniExampleGestureExtension",
+}
+
+# Kit keeps gesture callbacks on its native side, where Python's garbage collector can't free them.
+# The stand-ins put them here instead, and this list is never cleared.
+NATIVE_CALLBACKS = []
+
+# Weak references to the extensions, windows, manipulators and gesture managers created by the extensions
+TRACKED = []
+
+
+class _StandIn:
+    """
+    Accepts any arguments, keeps them alive like the real widget would, and can be used as a context manager.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Tracked(_StandIn):
+    """
+    A stand-in whose instances are counted after every cycle.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        TRACKED.append((type(self).__qualname__, weakref.ref(self)))
+
+
+class _Gesture(_StandIn):
+    """
+    Registers its callbacks in `NATIVE_CALLBACKS`, like Kit keeps them alive on its native side.
+    """
+
+    def __init__(self, *args, **kwargs):
+        NATIVE_CALLBACKS.extend(value for value in (*args, *kwargs.values()) if callable(value))
+
+
+class _Names:
+    """
+    Enum and color namespaces: every attribute is its own name.
+    """
+
+    def __getattr__(self, name):
+        return name
+
+
+class _Frame(_StandIn):
+    def set_build_fn(self, fn):
+        # The real frame builds lazily once visible; build right away so the gestures are wired
+        self.build_fn = fn
+        fn()
+
+
+class _Window(_Tracked):
+    def __init__(self, title, **kwargs):
+        super().__init__(title, **kwargs)
+        self.frame = _Frame()
+
+    def destroy(self):
+        self.frame = None
+
+
+class _Transform(_StandIn):
+    def __init__(self, *args, transform=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.transform = transform
+
+
+class _SceneView(_StandIn):
+    @property
+    def scene(self):
+        return self
+
+
+class _CameraModel(_StandIn):
+    def __init__(self, projection, view):
+        super().__init__()
+        identity = [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+        self.items = {"projection": list(projection), "view": identity}
+        self.callbacks = {}
+
+    def add_item_changed_fn(self, fn):
+        key = len(self.callbacks)
+        self.callbacks[key] = fn
+        return key
+
+    def remove_item_changed_fn(self, key):
+        self.callbacks.pop(key, None)
+
+    def get_item(self, name):
+        return name
+
+    def get_as_floats(self, item):
+        return self.items[item]
+
+
+class _Matrix44:
+    @staticmethod
+    def get_translation_matrix(*translate):
+        return [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, *translate, 1]
+
+
+class _EventStream:
+    def create_subscription_to_pop(self, fn, name=None):
+        # The subscription is released with the returned object, so the callback isn't registered as native
+        return _StandIn(fn, name=name)
+
+
+class _App:
+    def get_update_event_stream(self):
+        return _EventStream()
+
+
+class _RegisterScene:
+    def __init__(self, factory, name):
+        self.manipulator = factory({})
+        self.manipulator.on_build()
+
+
+def install_stand_ins(exts_root=EXTS_ROOT):
+    """
+    Puts minimal stand-ins for the Kit modules used by the extensions in `sys.modules`.
+    """
+
+    def module(name, **attrs):
+        result = types.ModuleType(name)
+        result.__dict__.update(attrs)
+        sys.modules[name] = result
+        return result
+
+    omni_paths = [os.path.join(exts_root, ext, "omni") for ext in EXTENSIONS]
+    omni = module("omni", __path__=omni_paths)
+    omni.ext = module("omni.ext", IExt=_Tracked)
+    scene = module(
+        "omni.ui.scene",
+        AspectRatioPolicy=_Names(),
+        CameraModel=_CameraModel,
+        ClickGesture=_Gesture,
+        DoubleClickGesture=_Gesture,
+        DragGesture=_Gesture,
+        GestureManager=_Tracked,
+        GestureState=_Names(),
+        HoverGesture=_Gesture,
+        Label=_StandIn,
+        Line=_StandIn,
+        Manipulator=_Tracked,
+        Matrix44=_Matrix44,
+        Rectangle=_StandIn,
+        SceneView=_SceneView,
+        Transform=_Transform,
+    )
+    omni.ui = module(
+        "omni.ui", Alignment=_Names(), Label=_StandIn, VStack=_StandIn, Window=_Window, color=_Names(), scene=scene
+    )
+    omni.ui_scene = module("omni.ui_scene", __path__=[])
+    omni.ui_scene._scene = module("omni.ui_scene._scene", AbstractGesture=_StandIn)
+    omni.kit = module("omni.kit", __path__=[])
+    omni.kit.app = module("omni.kit.app", get_app=_App)
+    omni.kit.viewport = module("omni.kit.viewport", __path__=[])
+    omni.kit.viewport.registry = module("omni.kit.viewport.registry", RegisterScene=_RegisterScene)
+
+
+def count_alive():
+    """
+    Returns the number of live tracked objects per type name.
+    """
+    gc.collect()
+    return Counter(name for name, ref in TRACKED if ref() is not None)
+
+
+def reload_extension(ext):
+    """
+    Drops the modules of an extension and imports them again, like a hot reload does.
+    """
+    for name in [name for name in sys.modules if name == ext or name.startswith(ext + ".")]:
+        del sys.modules[name]
+    return importlib.import_module(ext)
+
+
+def measure(ext, cycles):
+    """
+    Hot reloads the extension and runs startup/shutdown `cycles` times.
+
+    Yields:
+        A dict per cycle that maps a tracked type name to the number of its instances that the cycle left alive.
+    """
+    before = count_alive()
+    with open(os.devnull, "w") as devnull:
+        for _ in range(cycles):
+            with contextlib.redirect_stdout(devnull):
+                extension = getattr(reload_extension(ext), EXTENSIONS[ext])()
+                extension.on_startup("leak_check")
+                extension.on_shutdown()
+            del extension
+            after = count_alive()
+            yield {name: after[name] - before[name] for name in after if after[name] > before[name]}
+            before = after
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="Hot reload extensions, run startup/shutdown cycles and report the objects retained by each cycle"
+    )
+    parser.add_argument("--cycles", type=int, default=10, help="Number of startup/shutdown cycles")
+    parser.add_argument(
+        "--ext", choices=list(EXTENSIONS), action="append", help="Extension to check, all of them by default"
+    )
+    parser.add_argument("--exts-root", default=EXTS_ROOT, help="Folder with the extensions to check")
+    parser.add_argument("--fail-on-leak", action="store_true", help="Exit with 1 if any cycle after the first leaks")
+    args = parser.parse_args()
+
+    install_stand_ins(args.exts_root)
+
+    leaked = False
+    for ext in args.ext or EXTENSIONS:
+        print(f"\n{ext}:")
+        for i, retained in enumerate(measure(ext, args.cycles)):
+            details = ", ".join(f"{name}: {count}" for name, count in sorted(retained.items()))
+            print(f"{i}: {sum(retained.values())} objects retained" + (f" [{details}]" if details else ""))
+            # The first cycle may create module level objects that are expected to live on
+            if i > 0 and retained:
+                leaked = True
+
+    if leaked:
+        print("\nObjects are retained across startup/shutdown cycles")
+        if args.fail_on_leak:
+            sys.exit(1)
+    else:
+        print("\nNo objects retained after the first cycle")
@@ -1,22 +1,44 @@
 import argparse
 import json
 import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import packmanapi
 import urllib3
 
+LAUNCHER_URL = "http://127.0.0.1:33480/components"
+CACHE_TTL = 24 * 60 * 60
 
-def find_omniverse_apps():
+
+def default_cache_path():
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    else:
+        root = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(root, "ov", "link_app_cache.json")
+
+
+def default_scan_roots():
+    if sys.platform == "win32":
+        return [os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "ov", "pkg")]
+    return [os.path.expanduser("~/.local/share/ov/pkg")]
+
+
+def query_launcher(url=LAUNCHER_URL, timeout=2.0):
     http = urllib3.PoolManager()
     try:
-        r = http.request("GET", "http://127.0.0.1:33480/components")
+        r = http.request("GET", url, timeout=timeout, retries=False)
+        components = json.loads(r.data.decode("utf-8"))
+        if not isinstance(components, list):
+            raise ValueError(f"Unexpected response: {components}")
     except Exception as e:
-        print(f"Failed retrieving apps from an Omniverse Launcher, maybe it is not installed?\nError: {e}")
-        sys.exit(1)
+        print(f"Failed retrieving apps from an Omniverse Launcher, maybe it is not running?\nError: {e}")
+        return {}
 
     apps = {}
-    for x in json.loads(r.data.decode("utf-8")):
+    for x in components:
         latest = x.get("installedVersions", {}).get("latest", "")
         if latest:
             for s in x.get("settings", []):
@@ -27,7 +49,112 @@ def find_omniverse_apps():
     return apps
 
 
+def _scan_app(path):
+    # Launcher installs apps as '<slug>-<version>' folders, e.g. 'code-2022.3.3'
+    match = re.match(r"^(.+?)-(\d[\w.\-]*)$", os.path.basename(path))
+    if not match or not os.path.isdir(os.path.join(path, "kit")):
+        return None
+    version = tuple(int(n) for n in re.findall(r"\d+", match.group(2)))
+    return match.group(1).lower(), version, path
+
+
+def scan_filesystem(roots):
+    candidates = []
+    for root in roots:
+        try:
+            candidates += [entry.path for entry in os.scandir(root) if entry.is_dir()]
+        except OSError:
+            continue
+
+    latest = {}
+    with ThreadPoolExecutor() as executor:
+        for found in executor.map(_scan_app, candidates):
+            if found:
+                slug, version, path = found
+                if slug not in latest or version > latest[slug][0]:
+                    latest[slug] = (version, path)
+    return {slug: (slug.capitalize(), path.replace("\\", "/")) for slug, (_, path) in sorted(latest.items())}
+
+
+def _newer_version_installed(root):
+    found = _scan_app(root)
+    if not found:
+        return False
+    slug, version, _ = found
+    try:
+        siblings = [entry.path for entry in os.scandir(os.path.dirname(root)) if entry.is_dir()]
+    except OSError:
+        return False
+    for sibling in map(_scan_app, siblings):
+        if sibling and sibling[0] == slug and sibling[1] > version:
+            return True
+    return False
+
+
+def _cache_key(url, scan_roots):
+    return {"url": url, "scan_roots": sorted(os.path.abspath(root) for root in scan_roots)}
+
+
+def load_cache(path, url=LAUNCHER_URL, scan_roots=(), ttl=CACHE_TTL):
+    try:
+        with open(path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or not isinstance(cache.get("apps"), dict):
+        return None
+    # The cache only holds the apps found with the same Launcher URL and install folders
+    if cache.get("key") != _cache_key(url, scan_roots):
+        return None
+    written = cache.get("time")
+    now = time.time()
+    # A timestamp from the future would never expire
+    if isinstance(written, bool) or not isinstance(written, (int, float)) or not 0 <= now - written <= ttl:
+        return None
+    try:
+        apps = {slug: (name, root) for slug, (name, root) in cache["apps"].items()}
+    except (TypeError, ValueError):
+        return None
+    if not all(isinstance(name, str) and isinstance(root, str) for name, root in apps.values()):
+        return None
+    # Apps that were uninstalled, or that have a newer version installed next to them, invalidate the cache
+    if not apps or not all(os.path.exists(root) for _, root in apps.values()):
+        return None
+    if any(_newer_version_installed(root) for _, root in apps.values()):
+        return None
+    return apps
+
+
+def save_cache(path, apps, url=LAUNCHER_URL, scan_roots=()):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"time": time.time(), "key": _cache_key(url, scan_roots), "apps": apps}, f, indent=4)
+    except OSError as e:
+        print(f"Failed writing the app cache to '{path}': {e}")
+
+
+def find_omniverse_apps(cache_path=None, refresh=False, url=LAUNCHER_URL, scan_roots=None, ttl=CACHE_TTL):
+    cache_path = cache_path or default_cache_path()
+    scan_roots = scan_roots or default_scan_roots()
+    if not refresh:
+        apps = load_cache(cache_path, url, scan_roots, ttl)
+        if apps:
+            print(f"Using cached Omniverse Apps from '{cache_path}', pass --refresh to look for them again")
+            return apps
+
+    apps = query_launcher(url)
+    if not apps:
+        print("Scanning known install folders for Omniverse Apps...")
+        apps = scan_filesystem(scan_roots)
+    if apps:
+        save_cache(cache_path, apps, url, scan_roots)
+    return apps
+
+
 def create_link(src, dst):
+    import packmanapi
+
     print(f"Creating a link '{src}' -> '{dst}'")
     packmanapi.link(src, dst)
 
@@ -45,12 +172,23 @@ if __name__ == "__main__":
     parser.add_argument(
         "--app", help="Name of Kit App installed from Omniverse Launcher, e.g.: 'code', 'create'", required=False
     )
+    parser.add_argument(
+        "--refresh", action="store_true", help="Ignore the cached list of apps and look for installed apps again"
+    )
+    parser.add_argument("--cache", help="Path to the cache of found apps", default=default_cache_path())
+    parser.add_argument("--launcher-url", help="URL of the Omniverse Launcher components service", default=LAUNCHER_URL)
+    parser.add_argument(
+        "--scan-root",
+        action="append",
+        help="Extra folder with installed apps, scanned if the Launcher isn't running. Can be passed several times",
+    )
     args = parser.parse_args()
 
     path = args.path
     if not path:
         print("Path is not specified, looking for Omniverse Apps...")
-        apps = find_omniverse_apps()
+        scan_roots = default_scan_roots() + (args.scan_root or [])
+        apps = find_omniverse_apps(args.cache, args.refresh, args.launcher_url, scan_roots)
         if len(apps) == 0:
             print(
                 "Can't find any Omniverse Apps. Use Omniverse Launcher to install one. 'Code' is the recommended app for developers."
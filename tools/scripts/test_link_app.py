@@ -0,0 +1,148 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import link_app
+
+
+def _unused_url():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}/components"
+
+
+class _LauncherStandIn:
+    """
+    Serves a canned `/components` response on an ephemeral port.
+    """
+
+    def __init__(self, body):
+        data = json.dumps(body).encode("utf-8")
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/components"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestLinkApp(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp.name, "pkg")
+        self.cache = os.path.join(self.tmp.name, "cache", "apps.json")
+        for name in ("code-2022.3.3", "code-2023.1.0", "create-2023.2.1", "not-an-app"):
+            os.makedirs(os.path.join(self.root, name, "kit" if name != "not-an-app" else "data"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _install(self, name):
+        os.makedirs(os.path.join(self.root, name, "kit"))
+
+    def _path(self, name):
+        return os.path.join(self.root, name).replace("\\", "/")
+
+    def test_query_launcher(self):
+        launcher = _LauncherStandIn(
+            [
+                {
+                    "slug": "create",
+                    "name": "Omniverse Create",
+                    "installedVersions": {"latest": "2023.2.1"},
+                    "settings": [
+                        {"version": "2022.3.0", "launch": {"root": "old"}},
+                        {"version": "2023.2.1", "launch": {"root": self._path("create-2023.2.1")}},
+                    ],
+                },
+                {"slug": "view", "name": "Omniverse View", "installedVersions": {}, "settings": []},
+            ]
+        )
+        try:
+            apps = link_app.query_launcher(launcher.url)
+        finally:
+            launcher.close()
+        self.assertEqual(apps, {"create": ("Omniverse Create", self._path("create-2023.2.1"))})
+
+    def test_query_launcher_error_body(self):
+        launcher = _LauncherStandIn({"error": "not ready"})
+        try:
+            self.assertEqual(link_app.query_launcher(launcher.url), {})
+        finally:
+            launcher.close()
+
+    def test_scan_fallback(self):
+        apps = link_app.find_omniverse_apps(self.cache, url=_unused_url(), scan_roots=[self.root])
+        self.assertEqual(
+            apps, {"code": ("Code", self._path("code-2023.1.0")), "create": ("Create", self._path("create-2023.2.1"))}
+        )
+
+    def test_cache_hit_without_service(self):
+        url = _unused_url()
+        apps = link_app.find_omniverse_apps(self.cache, url=url, scan_roots=[self.root])
+        self.assertEqual(link_app.load_cache(self.cache, url, [self.root]), apps)
+
+    def test_cache_expiry(self):
+        url = _unused_url()
+        link_app.find_omniverse_apps(self.cache, url=url, scan_roots=[self.root])
+        self.assertIsNone(link_app.load_cache(self.cache, url, [self.root], ttl=-1))
+
+    def test_cache_keyed_on_inputs(self):
+        url = _unused_url()
+        link_app.find_omniverse_apps(self.cache, url=url, scan_roots=[self.root])
+        self.assertIsNone(link_app.load_cache(self.cache, url, ["/nonexistent"]))
+        self.assertIsNone(link_app.load_cache(self.cache, "http://127.0.0.1:1/components", [self.root]))
+
+    def test_cache_invalidated_by_update(self):
+        url = _unused_url()
+        link_app.find_omniverse_apps(self.cache, url=url, scan_roots=[self.root])
+        self._install("code-2023.2.0")
+        self.assertIsNone(link_app.load_cache(self.cache, url, [self.root]))
+
+    def test_invalid_cache_is_a_miss(self):
+        os.makedirs(os.path.dirname(self.cache))
+        key = link_app._cache_key(link_app.LAUNCHER_URL, [self.root])
+        app = ["Code", self._path("code-2023.1.0")]
+        contents = [
+            "[1, 2]",
+            '{"apps": [1]}',
+            "not json",
+            json.dumps({"key": key, "time": None, "apps": {"code": app}}),
+            json.dumps({"key": key, "time": "now", "apps": {"code": app}}),
+            json.dumps({"key": key, "time": True, "apps": {"code": app}}),
+            json.dumps({"key": key, "time": time.time() + 3600, "apps": {"code": app}}),
+            json.dumps({"key": key, "time": time.time(), "apps": {"code": ["Code", 2]}}),
+            json.dumps({"key": key, "time": time.time(), "apps": {"code": [None, app[1]]}}),
+        ]
+        for content in contents:
+            with open(self.cache, "w") as f:
+                f.write(content)
+            self.assertIsNone(link_app.load_cache(self.cache, link_app.LAUNCHER_URL, [self.root]), content)
+
+        # The same entry with valid fields is a hit
+        with open(self.cache, "w") as f:
+            json.dump({"key": key, "time": time.time(), "apps": {"code": app}}, f)
+        self.assertEqual(link_app.load_cache(self.cache, link_app.LAUNCHER_URL, [self.root]), {"code": tuple(app)})
+
+
+if __name__ == "__main__":
+    unittest.main()